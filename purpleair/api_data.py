@@ -5,6 +5,21 @@ Constants for PurpleAir API
 
 API_ROOT = 'https://www.purpleair.com/json'
 THINGSPEAK_API_URL = "https://thingspeak.com/channels/{channel}/feed.{dataformat}?"
+# Maximum concurrent ThingSpeak requests, kept low to respect their rate limits
+THINGSPEAK_MAX_WORKERS = 8
+
+# Column types of ThingSpeak CSV feeds, primary and secondary share the same layout
+THINGSPEAK_CSV_DTYPES = {
+    'entry_id': 'int64',
+    'field1': 'float64',
+    'field2': 'float64',
+    'field3': 'float64',
+    'field4': 'float64',
+    'field5': 'float64',
+    'field6': 'float64',
+    'field7': 'float64',
+    'field8': 'float64',
+}
 
 PARENT_PRIMARY_COLS = {
     'created_at': 'created_at',
@@ -2,9 +2,14 @@
 Representation of sensor channel data
 """
 
-import json
-from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from io import BytesIO
+from math import nan
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 
 from urllib.parse import urlencode
 from requests_cache import CachedSession
@@ -12,12 +17,80 @@ from requests_cache import CachedSession
 import pandas as pd
 import thingspeak
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore
+
 from .api_data import (
     PARENT_PRIMARY_COLS,
     PARENT_SECONDARY_COLS,
     CHILD_PRIMARY_COLS,
     CHILD_SECONDARY_COLS,
-    THINGSPEAK_API_URL)
+    THINGSPEAK_API_URL,
+    THINGSPEAK_CSV_DTYPES,
+    THINGSPEAK_MAX_WORKERS)
+
+_UTC = timezone.utc
+
+# pyarrow's multi-threaded CSV reader is optional
+_CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+
+@lru_cache(maxsize=None)
+def _get_session(cache_name: str) -> CachedSession:
+    """
+    Shared sqlite cached session for one API, created on first use
+    """
+    return CachedSession(
+        cache_name, backend='sqlite', expire_after=timedelta(hours=1))
+
+
+def _read_thingspeak_csv(session: CachedSession, url: str) -> pd.DataFrame:
+    """
+    Download a ThingSpeak CSV through `session` and load it into a DataFrame
+    """
+    response = session.get(url)
+    response.raise_for_status()
+    return _parse_thingspeak_csv(response.content)
+
+
+def _parse_thingspeak_csv(content: bytes) -> pd.DataFrame:
+    """
+    Load a ThingSpeak CSV into a DataFrame, typing whichever known columns it has
+
+    Averaged queries have no `entry_id` and some feeds have fewer than eight fields;
+    the pyarrow engine fails on `dtype` keys that are not columns, so only the
+    present ones are passed.
+    """
+    header = pd.read_csv(BytesIO(content), nrows=0).columns
+    dtypes = {col: dtype for col, dtype in THINGSPEAK_CSV_DTYPES.items()
+              if col in header}
+    return pd.read_csv(BytesIO(content), engine=_CSV_ENGINE, dtype=dtypes)
+
+
+def _to_float(value) -> float:
+    """
+    Convert an API value with `float()` like `Channel.setup()`, returning NaN on failure
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return nan
+
+
+def bulk_prepare(results: List[dict]) -> List[dict]:
+    """
+    Parse the embedded `Stats` JSON of every channel in a `results` list in place
+
+    Callers constructing many `Channel`s from a single API response should run
+    this first so each `Channel` does not have to parse its own `Stats` string
+    """
+    for channel_data in results:
+        stats_raw = channel_data.get('Stats')
+        if stats_raw and not isinstance(stats_raw, dict):
+            channel_data['Stats'] = json_loads(stats_raw)
+    return results
 
 
 class Channel():
@@ -25,137 +98,301 @@ class Channel():
     Representation of sensor channel data
     """
 
+    # (attribute, API key) pairs for values coerced to float in `setup()`
+    _FLOAT_FIELDS = (
+        ('lat', 'Lat'),
+        ('lon', 'Lon'),
+        ('current_pm2_5', 'PM2_5Value'),
+        ('current_temp_f', 'temp_f'),
+        ('current_humidity', 'humidity'),
+        ('current_pressure', 'pressure'),
+        ('current_p_0_3_um', 'p_0_3_um'),
+        ('current_p_0_5_um', 'p_0_5_um'),
+        ('current_p_1_0_um', 'p_1_0_um'),
+        ('current_p_2_5_um', 'p_2_5_um'),
+        ('current_p_5_0_um', 'p_5_0_um'),
+        ('current_p_10_0_um', 'p_10_0_um'),
+        ('current_pm1_0_cf_1', 'pm1_0_cf_1'),
+        ('current_pm2_5_cf_1', 'pm2_5_cf_1'),
+        ('current_pm10_0_cf_1', 'pm10_0_cf_1'),
+        ('current_pm1_0_atm', 'pm1_0_atm'),
+        ('current_pm2_5_atm', 'pm2_5_atm'),
+        ('current_pm10_0_atm', 'pm10_0_atm'),
+    )
+
+    # API keys for (primary channel, primary key, secondary channel, secondary key)
+    _THINGSPEAK_ID_KEYS = (
+        'THINGSPEAK_PRIMARY_ID',
+        'THINGSPEAK_PRIMARY_ID_READ_KEY',
+        'THINGSPEAK_SECONDARY_ID',
+        'THINGSPEAK_SECONDARY_ID_READ_KEY',
+    )
+
+    # Default ThingSpeak query arguments, `api_key` is filled in per channel
+    _THINGSPEAK_DEFAULT_ARGS = {
+        'api_key': None,
+        'offset': 0,
+        'average': '',
+        'round': 2,
+    }
+
+    # API values that map to a boolean flag, anything else gets the default in `setup()`
+    _HIDDEN_MAP: Dict[Any, bool] = {'false': False}
+    _FLAG_MAP: Dict[Any, bool] = {1: True}
+    _DOWNGRADED_MAP: Dict[Any, bool] = {'true': True}
+
+    # (output key, attribute) pairs for each category of `as_dict()`
+    _META_FIELDS = (
+        ('id', 'identifier'),
+        ('parent', 'parent'),
+        ('lat', 'lat'),
+        ('lon', 'lon'),
+        ('name', 'name'),
+        ('location_type', 'location_type'),
+    )
+    _DATA_FIELDS = (
+        ('pm_2.5', 'current_pm2_5'),
+        ('temp_f', 'current_temp_f'),
+        ('temp_c', 'current_temp_c'),
+        ('humidity', 'current_humidity'),
+        ('pressure', 'current_pressure'),
+        ('p_0_3_um', 'current_p_0_3_um'),
+        ('p_0_5_um', 'current_p_0_5_um'),
+        ('p_1_0_um', 'current_p_1_0_um'),
+        ('p_2_5_um', 'current_p_2_5_um'),
+        ('p_5_0_um', 'current_p_5_0_um'),
+        ('p_10_0_um', 'current_p_10_0_um'),
+        ('pm1_0_cf_1', 'current_pm1_0_cf_1'),
+        ('pm2_5_cf_1', 'current_pm2_5_cf_1'),
+        ('pm10_0_cf_1', 'current_pm10_0_cf_1'),
+        ('pm1_0_atm', 'current_pm1_0_atm'),
+        ('pm2_5_atm', 'current_pm2_5_atm'),
+        ('pm10_0_atm', 'current_pm10_0_atm'),
+    )
+    _DIAGNOSTIC_FIELDS = (
+        ('last_seen', 'last_seen'),
+        ('model', 'model'),
+        ('adc', 'adc'),
+        ('rssi', 'rssi'),
+        ('hidden', 'hidden'),
+        ('flagged', 'flagged'),
+        ('downgraded', 'downgraded'),
+        ('age', 'age'),
+        ('brightness', 'brightness'),
+        ('hardware', 'hardware'),
+        ('version', 'version'),
+        ('last_update_check', 'last_update_check'),
+        ('created', 'created'),
+        ('uptime', 'uptime'),
+        ('is_owner', 'is_owner'),
+    )
+    _STATISTICS_FIELDS = (
+        ('10min_avg', 'm10avg'),
+        ('30min_avg', 'm30avg'),
+        ('1hour_avg', 'h1ravg'),
+        ('6hour_avg', 'h6ravg'),
+        ('1day_avg', 'd1avg'),
+        ('1week_avg', 'w1avg'),
+    )
+
+    # Precomputed (category, keys, attribute getter) used by `as_dict()`
+    _DICT_SCHEMA = tuple(
+        (category, tuple(key for key, _ in fields),
+         attrgetter(*(attr for _, attr in fields)))
+        for category, fields in (
+            ('meta', _META_FIELDS),
+            ('data', _DATA_FIELDS),
+            ('diagnostic', _DIAGNOSTIC_FIELDS),
+            ('statistics', _STATISTICS_FIELDS),
+        )
+    )
+    _ALL_FIELDS = _META_FIELDS + _DATA_FIELDS + \
+        _DIAGNOSTIC_FIELDS + _STATISTICS_FIELDS
+    _ALL_KEYS = tuple(key for key, _ in _ALL_FIELDS)
+    _ALL_ATTRS = attrgetter(*(attr for _, attr in _ALL_FIELDS))
+
+    __slots__ = (
+        'channel_data',
+        # Meta
+        'identifier', 'parent', 'type', 'name', 'location_type',
+        # Data, everything in `_FLOAT_FIELDS` plus
+        'current_temp_c',
+        # Statistics
+        'pm2_5stats', 'm10avg', 'm30avg', 'h1ravg', 'h6ravg', 'd1avg', 'w1avg',
+        'last_modified_stats', 'last2_modified',
+        # ThingSpeak
+        'tp_primary_channel', 'tp_primary_key', 'tp_secondary_channel',
+        'tp_secondary_key', '_thingspeak_primary', '_thingspeak_secondary',
+        '_thingspeak_default_query',
+        # Diagnostic
+        'last_seen', 'model', 'adc', 'rssi', 'hidden', 'flagged', 'downgraded',
+        'age', 'brightness', 'hardware', 'version', 'last_update_check',
+        'created', 'uptime', 'is_owner',
+    ) + tuple(attr for attr, _ in _FLOAT_FIELDS)
+
+    lat: Optional[float]
+    lon: Optional[float]
+    current_pm2_5: Optional[float]
+    current_temp_f: Optional[float]
+    current_humidity: Optional[float]
+    current_pressure: Optional[float]
+    current_p_0_3_um: Optional[float]
+    current_p_0_5_um: Optional[float]
+    current_p_1_0_um: Optional[float]
+    current_p_2_5_um: Optional[float]
+    current_p_5_0_um: Optional[float]
+    current_p_10_0_um: Optional[float]
+    current_pm1_0_cf_1: Optional[float]
+    current_pm2_5_cf_1: Optional[float]
+    current_pm10_0_cf_1: Optional[float]
+    current_pm1_0_atm: Optional[float]
+    current_pm2_5_atm: Optional[float]
+    current_pm10_0_atm: Optional[float]
+    tp_primary_channel: Optional[str]
+    tp_primary_key: Optional[str]
+    tp_secondary_channel: Optional[str]
+    tp_secondary_key: Optional[str]
+
     def __init__(self, channel_data: dict):
         self.channel_data = channel_data
         self.setup()
 
-    def safe_float(self, key: str) -> Optional[float]:
-        """
-        Convert to float if the item exists, otherwise return none
-        """
-        result: Optional[float] = self.channel_data.get(key)
-        if result is not None:
-            try:
-                result = float(result)
-            except TypeError:
-                return None
-            except ValueError:
-                return None
-        return result
-
     def setup(self) -> None:
         """
         Initialize metadata and real data for a sensor; for detailed info see docs
         """
+        # Convert to float if the item exists, otherwise set to None
+        data = self.channel_data
+        for attr, key in self._FLOAT_FIELDS:
+            value = data.get(key)
+            try:
+                setattr(self, attr, float(value)
+                        if value is not None else None)
+            except (TypeError, ValueError):
+                setattr(self, attr, None)
+
         # Meta
-        self.lat: Optional[float] = self.safe_float('Lat')
-        self.lon: Optional[float] = self.safe_float('Lon')
-        self.identifier: Optional[int] = self.channel_data.get('ID')
-        self.parent: Optional[int] = self.channel_data.get('ParentID')
+        self.identifier: Optional[int] = data.get('ID')
+        self.parent: Optional[int] = data.get('ParentID')
         self.type: str = 'parent' if self.parent is None else 'child'
-        self.name: Optional[str] = self.channel_data.get('Label')
+        self.name: Optional[str] = data.get('Label')
         # pylint: disable=line-too-long
-        self.location_type: Optional[str] = self.channel_data.get(
+        self.location_type: Optional[str] = data.get(
             'DEVICE_LOCATIONTYPE')
 
         # Data, possible TODO: abstract to class
-        self.current_pm2_5: Optional[float] = self.safe_float('PM2_5Value')
-        self.current_temp_f: Optional[float] = self.safe_float('temp_f')
         self.current_temp_c = (self.current_temp_f - 32) * (5 / 9) \
             if self.current_temp_f is not None else None
-        self.current_humidity: Optional[float] = self.safe_float('humidity')
-        self.current_pressure: Optional[float] = self.safe_float('pressure')
-        self.current_p_0_3_um: Optional[float] = self.safe_float('p_0_3_um')
-        self.current_p_0_5_um: Optional[float] = self.safe_float('p_0_5_um')
-        self.current_p_1_0_um: Optional[float] = self.safe_float('p_1_0_um')
-        self.current_p_2_5_um: Optional[float] = self.safe_float('p_2_5_um')
-        self.current_p_5_0_um: Optional[float] = self.safe_float('p_5_0_um')
-        self.current_p_10_0_um: Optional[float] = self.safe_float('p_10_0_um')
-        self.current_pm1_0_cf_1: Optional[float] = self.safe_float(
-            'pm1_0_cf_1')
-        self.current_pm2_5_cf_1: Optional[float] = self.safe_float(
-            'pm2_5_cf_1')
-        self.current_pm10_0_cf_1: Optional[float] = self.safe_float(
-            'pm10_0_cf_1')
-        self.current_pm1_0_atm: Optional[float] = self.safe_float('pm1_0_atm')
-        self.current_pm2_5_atm: Optional[float] = self.safe_float('pm2_5_atm')
-        self.current_pm10_0_atm: Optional[float] = self.safe_float(
-            'pm10_0_atm')
 
         # Statistics
-        self.pm2_5stats: Optional[dict] = json.loads(
-            self.channel_data['Stats']) if 'Stats' in self.channel_data else None
-        self.m10avg: Optional[float] = self.pm2_5stats.get(
-            'v1') if self.pm2_5stats else None
-        self.m30avg: Optional[float] = self.pm2_5stats.get(
-            'v2') if self.pm2_5stats else None
-        self.h1ravg: Optional[float] = self.pm2_5stats.get(
-            'v3') if self.pm2_5stats else None
-        self.h6ravg: Optional[float] = self.pm2_5stats.get(
-            'v4') if self.pm2_5stats else None
-        self.d1avg: Optional[float] = self.pm2_5stats.get(
-            'v5') if self.pm2_5stats else None
-        self.w1avg: Optional[float] = self.pm2_5stats.get(
-            'v6') if self.pm2_5stats else None
+        # Stats may have already been parsed in bulk, see `bulk_prepare()`
+        stats_raw = data.get('Stats')
+        self.pm2_5stats: Optional[dict] = stats_raw if isinstance(stats_raw, dict) \
+            else (json_loads(stats_raw) if stats_raw else None)
+        stats = self.pm2_5stats or {}
+        self.m10avg: Optional[float] = stats.get('v1')
+        self.m30avg: Optional[float] = stats.get('v2')
+        self.h1ravg: Optional[float] = stats.get('v3')
+        self.h6ravg: Optional[float] = stats.get('v4')
+        self.d1avg: Optional[float] = stats.get('v5')
+        self.w1avg: Optional[float] = stats.get('v6')
         self.last_modified_stats: Optional[datetime] = None
-        last_mod = self.pm2_5stats.get('lastModified') \
-            if self.pm2_5stats is not None else None
+        last_mod = stats.get('lastModified')
         if last_mod is not None:
-            self.last_modified_stats = datetime.utcfromtimestamp(
-                int(last_mod) / 1000)
-        self.last2_modified: Optional[int] = self.pm2_5stats.get(
-            'timeSinceModified') if self.pm2_5stats is not None else None
+            self.last_modified_stats = datetime.fromtimestamp(
+                float(last_mod) / 1000, _UTC)
+        self.last2_modified: Optional[int] = stats.get('timeSinceModified')
 
         # ThingSpeak IDs, if these are missing do not crash, just set to None
-        try:
-            self.tp_primary_channel: Optional[str] = self.channel_data['THINGSPEAK_PRIMARY_ID']
-            self.tp_primary_key: Optional[str] = self.channel_data['THINGSPEAK_PRIMARY_ID_READ_KEY']
-            self.tp_secondary_channel: Optional[str] = self.channel_data['THINGSPEAK_SECONDARY_ID']
-            self.tp_secondary_key: Optional[str] = self.channel_data['THINGSPEAK_SECONDARY_ID_READ_KEY']
-            self.thingspeak_primary: Optional[thingspeak.Channel] = thingspeak.Channel(
-                id=self.tp_primary_channel, api_key=self.tp_primary_key)
-            self.thingspeak_secondary: Optional[thingspeak.Channel] = thingspeak.Channel(
-                id=self.tp_secondary_channel, api_key=self.tp_secondary_key)
-        except KeyError:
+        # Built on first use in `get_thingspeak_url()`, most channels never need it
+        self._thingspeak_default_query: Optional[dict] = None
+        thingspeak_ids = [data.get(key) for key in self._THINGSPEAK_ID_KEYS]
+        if None in thingspeak_ids:
             # Doing this prevents a crash until we actually access ThingSpeak data
             #   which the user may not do
-            self.tp_primary_channel = None
-            self.tp_primary_key = None
-            self.tp_secondary_channel = None
-            self.tp_secondary_key = None
-            self.thingspeak_primary = None
-            self.thingspeak_secondary = None
+            thingspeak_ids = [None] * len(self._THINGSPEAK_ID_KEYS)
+        (self.tp_primary_channel, self.tp_primary_key,
+         self.tp_secondary_channel, self.tp_secondary_key) = thingspeak_ids
+        # Built on first access, see `thingspeak_primary` and `thingspeak_secondary`
+        self._thingspeak_primary: Optional[thingspeak.Channel] = None
+        self._thingspeak_secondary: Optional[thingspeak.Channel] = None
 
         # Diagnostic
-        last_seen = self.channel_data.get('LastSeen')
+        last_seen = data.get('LastSeen')
         if last_seen is not None:
-            self.last_seen: Optional[datetime] = datetime.utcfromtimestamp(
-                int(last_seen))
+            self.last_seen: Optional[datetime] = datetime.fromtimestamp(
+                int(last_seen), _UTC)
         else:
             self.last_seen = last_seen
-        self.model: Optional[str] = self.channel_data.get('Type')
-        self.adc: Optional[str] = self.channel_data.get('Adc')
-        self.rssi: Optional[str] = self.channel_data.get('RSSI')
-        # pylint: disable=simplifiable-if-expression
-        self.hidden = False if self.channel_data.get(
-            'Hidden') == 'false' else True
-        # pylint: disable=simplifiable-if-expression
-        self.flagged = True if self.channel_data.get('Flag') == 1 else False
-        # pylint: disable=simplifiable-if-expression
-        self.downgraded = True if self.channel_data.get(
-            'A_H') == 'true' else False
+        self.model: Optional[str] = data.get('Type')
+        self.adc: Optional[str] = data.get('Adc')
+        self.rssi: Optional[str] = data.get('RSSI')
+        self.hidden: bool = self._HIDDEN_MAP.get(
+            data.get('Hidden'), True)
+        self.flagged: bool = self._FLAG_MAP.get(
+            data.get('Flag'), False)
+        self.downgraded: bool = self._DOWNGRADED_MAP.get(
+            data.get('A_H'), False)
         # Number of minutes old the data is
-        self.age: Optional[int] = self.channel_data.get('AGE')
-        self.brightness: Optional[str] = self.channel_data.get(
+        self.age: Optional[int] = data.get('AGE')
+        self.brightness: Optional[str] = data.get(
             'DEVICE_BRIGHTNESS')
-        self.hardware: Optional[str] = self.channel_data.get(
+        self.hardware: Optional[str] = data.get(
             'DEVICE_HARDWAREDISCOVERED')
-        self.version: Optional[str] = self.channel_data.get('Version')
-        self.last_update_check: Optional[int] = self.channel_data.get(
+        self.version: Optional[str] = data.get('Version')
+        self.last_update_check: Optional[int] = data.get(
             'LastUpdateCheck')
-        self.created: Optional[int] = self.channel_data.get('Created')
-        self.uptime: Optional[int] = self.channel_data.get('Uptime')
-        self.is_owner: Optional[bool] = bool(self.channel_data.get('isOwner'))
+        self.created: Optional[int] = data.get('Created')
+        self.uptime: Optional[int] = data.get('Uptime')
+        self.is_owner: Optional[bool] = bool(data.get('isOwner'))
+
+    @classmethod
+    def bulk_from_results(cls, results: List[dict]) -> pd.DataFrame:
+        """
+        Build a DataFrame with one row per channel from a PurpleAir `results` list
+
+        Float columns are coerced and `Stats` parsed column by column, and `LastSeen` is
+        converted with a single `pd.to_datetime` call. Parsed `Stats` values are expanded
+        into `Stats.<key>` columns. `results` is not modified.
+        """
+        data = pd.DataFrame(results, dtype=object)
+
+        float_cols = [key for _, key in cls._FLOAT_FIELDS if key in data]
+        for col in float_cols:
+            data[col] = pd.Series([_to_float(value) for value in data[col]],
+                                  index=data.index, dtype='float64')
+        if 'LastSeen' in data:
+            data['LastSeen'] = pd.to_datetime(
+                data['LastSeen'], unit='s', utc=True)
+
+        if 'Stats' in data:
+            stats = [json_loads(item) if isinstance(item, str) and item else item
+                     for item in data['Stats']]
+            data['Stats'] = stats
+            expanded = pd.DataFrame(
+                [item if isinstance(item, dict) else {} for item in stats], index=data.index)
+            data = data.join(expanded.add_prefix('Stats.'))
+        return data
+
+    @property
+    def thingspeak_primary(self) -> Optional[thingspeak.Channel]:
+        """
+        `thingspeak.Channel` for the primary feed, created on first access
+        """
+        if self._thingspeak_primary is None and self.tp_primary_channel is not None:
+            self._thingspeak_primary = thingspeak.Channel(
+                id=self.tp_primary_channel, api_key=self.tp_primary_key)
+        return self._thingspeak_primary
+
+    @property
+    def thingspeak_secondary(self) -> Optional[thingspeak.Channel]:
+        """
+        `thingspeak.Channel` for the secondary feed, created on first access
+        """
+        if self._thingspeak_secondary is None and self.tp_secondary_channel is not None:
+            self._thingspeak_secondary = thingspeak.Channel(
+                id=self.tp_secondary_channel, api_key=self.tp_secondary_key)
+        return self._thingspeak_secondary
 
     @property
     def created_date(self):
@@ -168,9 +405,8 @@ class Channel():
                 1990, 1, 1), end=None, thingspeak_args={
                 'results': 1}, dataformat='json')
 
-        session = CachedSession(expire_after=timedelta(hours=1))
-        response = session.get(url)
-        data = json.loads(response.content)
+        response = _get_session('thingspeak_cache').get(url)
+        data = json_loads(response.content)
         created_at = datetime.strptime(
             data['channel']['created_at'],
             '%Y-%m-%dT%H:%M:%SZ')
@@ -208,24 +444,28 @@ class Channel():
         else:
             thingspeak_args = {}
 
-        default_args = {
-            'api_key': key,
-            'offset': 0,
-            'average': '',
-            'round': 2,
-        }
-
-        for key, val in default_args.items():
-            if key not in thingspeak_args:
-                thingspeak_args[key] = val
+        if not any(arg in thingspeak_args for arg in self._THINGSPEAK_DEFAULT_ARGS):
+            # Nothing is overridden, so the encoded defaults can be reused
+            if self._thingspeak_default_query is None:
+                self._thingspeak_default_query = {}
+            default_query = self._thingspeak_default_query.get(thingspeak_field)
+            if default_query is None:
+                default_query = urlencode(
+                    {**self._THINGSPEAK_DEFAULT_ARGS, 'api_key': key})
+                self._thingspeak_default_query[thingspeak_field] = default_query
+        else:
+            default_query = urlencode({
+                arg: val for arg, val in {**self._THINGSPEAK_DEFAULT_ARGS, 'api_key': key}.items()
+                if arg not in thingspeak_args})
 
-        thingspeak_args['start'] = start.strftime("%Y-%m-%d 00:00:00")
+        thingspeak_args['start'] = f'{start:%Y-%m-%d} 00:00:00'
         if end:
-            thingspeak_args['end'] = end.strftime("%Y-%m-%d 00:00:00")
+            thingspeak_args['end'] = f'{end:%Y-%m-%d} 00:00:00'
 
         base_url = THINGSPEAK_API_URL.format(
             channel=channel, dataformat=dataformat)
-        return base_url + urlencode(thingspeak_args)
+        return base_url + '&'.join(
+            query for query in (urlencode(thingspeak_args), default_query) if query)
 
     def clean_data(self, thingspeak_field, data):
         """
@@ -245,8 +485,16 @@ class Channel():
         columns = parent_cols if self.type == 'parent' else child_cols
 
         data.rename(columns=columns, inplace=True)
-        data['created_at'] = pd.to_datetime(
-            data['created_at'], format='%Y-%m-%d %H:%M:%S %Z')
+        created_at = data['created_at']
+        # pyarrow types the column of an empty result as float, which has no `.str`
+        if pd.api.types.is_string_dtype(created_at) and len(created_at) \
+                and created_at.str.endswith(' UTC').all():
+            # %Z is the slowest directive to parse, so drop the suffix when it is always UTC
+            data['created_at'] = pd.to_datetime(
+                created_at.str.slice(0, 19), format='%Y-%m-%d %H:%M:%S', utc=True, cache=True)
+        else:
+            data['created_at'] = pd.to_datetime(
+                created_at, format='%Y-%m-%d %H:%M:%S %Z', utc=True, cache=True)
 
         try:
             data.index = data.pop('entry_id')
@@ -307,7 +555,8 @@ class Channel():
             first_date,
             last_date,
             thingspeak_args)
-        return self.clean_data(thingspeak_field, pd.read_csv(url))
+        return self.clean_data(thingspeak_field, _read_thingspeak_csv(
+            _get_session('thingspeak_cache'), url))
 
     def get_historical(self,
                        weeks_to_get: int,
@@ -318,18 +567,20 @@ class Channel():
         Get data from the ThingSpeak API one week at a time up to weeks_to_get weeks in the past.
 
         """
+        urls = []
         to_week = start_date - timedelta(weeks=1)
-        weekly_data = []
-        while weeks_to_get > 0:
-            for _ in range(weeks_to_get):
-                start_date = to_week  # DateTimes are immutable so this reference is not a problem
-                to_week = to_week - timedelta(weeks=1)
-                url = self.get_thingspeak_url(
-                    thingspeak_field, to_week, start_date, thingspeak_args)
-                weekly_data.append(pd.read_csv(url))
-                weeks_to_get -= 1
-
-        weekly_data = pd.concat(weekly_data)
+        for _ in range(weeks_to_get):
+            start_date = to_week  # DateTimes are immutable so this reference is not a problem
+            to_week = to_week - timedelta(weeks=1)
+            urls.append(self.get_thingspeak_url(
+                thingspeak_field, to_week, start_date, thingspeak_args))
+
+        # Each week is network bound, so fetch them concurrently; `map` keeps them in order.
+        #   The session is created here, as workers racing to create it would each get one
+        session = _get_session('thingspeak_cache')
+        with ThreadPoolExecutor(max_workers=THINGSPEAK_MAX_WORKERS) as executor:
+            weekly_data = pd.concat(executor.map(
+                partial(_read_thingspeak_csv, session), urls))
 
         # Handle formatting the DataFrame column names
         return self.clean_data(thingspeak_field, weekly_data)
@@ -338,74 +589,16 @@ class Channel():
         """
         Returns a dictionary representation of the channel data
         """
-        out_d = {
-            'meta': {
-                'id': self.identifier,
-                'parent': self.parent,
-                'lat': self.lat,
-                'lon': self.lon,
-                'name': self.name,
-                'location_type': self.location_type
-            },
-            'data': {
-                'pm_2.5': self.current_pm2_5,
-                'temp_f': self.current_temp_f,
-                'temp_c': self.current_temp_c,
-                'humidity': self.current_humidity,
-                'pressure': self.current_pressure,
-                'p_0_3_um': self.current_p_0_3_um,
-                'p_0_5_um': self.current_p_0_5_um,
-                'p_1_0_um': self.current_p_1_0_um,
-                'p_2_5_um': self.current_p_2_5_um,
-                'p_5_0_um': self.current_p_5_0_um,
-                'p_10_0_um': self.current_p_10_0_um,
-                'pm1_0_cf_1': self.current_pm1_0_cf_1,
-                'pm2_5_cf_1': self.current_pm2_5_cf_1,
-                'pm10_0_cf_1': self.current_pm10_0_cf_1,
-                'pm1_0_atm': self.current_pm1_0_atm,
-                'pm2_5_atm': self.current_pm2_5_atm,
-                'pm10_0_atm': self.current_pm10_0_atm
-            },
-            'diagnostic': {
-                'last_seen': self.last_seen,
-                'model': self.model,
-                'adc': self.adc,
-                'rssi': self.rssi,
-                'hidden': self.hidden,
-                'flagged': self.flagged,
-                'downgraded': self.downgraded,
-                'age': self.age,
-                'brightness': self.brightness,
-                'hardware': self.hardware,
-                'version': self.version,
-                'last_update_check': self.last_update_check,
-                'created': self.created,
-                'uptime': self.uptime,
-                'is_owner': self.is_owner
-            },
-            'statistics': {
-                '10min_avg': self.m10avg,
-                '30min_avg': self.m30avg,
-                '1hour_avg': self.h1ravg,
-                '6hour_avg': self.h6ravg,
-                '1day_avg': self.d1avg,
-                '1week_avg': self.w1avg
-            }
+        return {
+            category: dict(zip(keys, attrs(self)))
+            for category, keys, attrs in self._DICT_SCHEMA
         }
 
-        return out_d
-
     def as_flat_dict(self) -> dict:
         """
         Returns a flat dictionary representation of channel data
         """
-        out_d = {}
-        nested = self.as_dict()
-        # pylint: disable=consider-using-dict-items
-        for category in nested:
-            for prop in nested[category]:
-                out_d[prop] = nested[category][prop]
-        return out_d
+        return dict(zip(self._ALL_KEYS, self._ALL_ATTRS(self)))
 
     def __repr__(self):
         """
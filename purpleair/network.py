@@ -3,16 +3,11 @@ PurpleAir API Client Class
 """
 
 
-import json
 import time
-from json.decoder import JSONDecodeError
-from typing import List, Optional, Union
-from datetime import timedelta
+from typing import Iterable, List, Optional, Union
 
 import pandas as pd
-from requests_cache import CachedSession
 
-from .api_data import API_ROOT
 from .sensor import Sensor
 
 
@@ -34,25 +29,10 @@ class SensorList():
         """
         Get all data from the API
         """
-        session = CachedSession(expire_after=timedelta(hours=1))
-        response = session.get(f'{API_ROOT}?q=""')
-        try:
-            data = json.loads(response.content)
-        except JSONDecodeError as err:
-            raise ValueError(
-                'Invalid JSON data returned from network!') from err
-
-        # Handle rate limit or other error message
-        if 'results' not in data:
-            message = data.get('message')
-            error_message = message if message is not None else data
-            raise ValueError(
-                f'No sensor data returned from PurpleAir: {error_message}')
-
-        self.parse_raw_result(data['results'])
+        self.parse_raw_result(Sensor.list_all())
         print(f"Initialized {len(self.data):,} sensors!")
 
-    def parse_raw_result(self, flat_sensor_data: dict) -> None:
+    def parse_raw_result(self, flat_sensor_data: Iterable[dict]) -> None:
         """
         O(2n) algorithm to build the network map
         """
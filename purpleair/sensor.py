@@ -5,15 +5,28 @@ PurpleAir Sensor Client
 
 import json
 import os
+from json.decoder import JSONDecodeError
 from re import sub
-from typing import Optional, List
-from datetime import timedelta
+from typing import Iterator, List, Optional
 
-from requests_cache import CachedSession
 from geopy.geocoders import Nominatim
 
 from .api_data import API_ROOT
-from .channel import Channel
+from .channel import Channel, _get_session, bulk_prepare, json_loads
+
+
+# Bits set in `Sensor.get_invalid_mask()` for each failed `is_useful()` check
+INVALID_LOCATION = 1 << 0
+INVALID_HIDDEN = 1 << 1
+INVALID_FLAGGED = 1 << 2
+INVALID_DOWNGRADED = 1 << 3
+INVALID_PM2_5 = 1 << 4
+INVALID_TEMP_F = 1 << 5
+INVALID_HUMIDITY = 1 << 6
+INVALID_PRESSURE = 1 << 7
+INVALID_STATS = 1 << 8
+INVALID_LAST_MODIFIED_STATS = 1 << 9
+INVALID_LAST2_MODIFIED = 1 << 10
 
 
 class Sensor():
@@ -21,6 +34,10 @@ class Sensor():
     Representation of a single PurpleAir sensor
     """
 
+    __slots__ = ('data', 'parent_data', 'identifier', 'child_data',
+                 'parse_location', 'thingspeak_data', 'parent', 'child',
+                 'location_type', 'location', '_invalid_mask')
+
     def __init__(
             self,
             identifier: int,
@@ -37,16 +54,17 @@ class Sensor():
             raise ValueError(
                 f'Sensor {identifier} created without valid data')
 
-        self.parent_data: dict = self.data[0]
-        self.identifier = self.parent_data['ID']
-        self.child_data: Optional[dict] = self.data[1] if len(
-            self.data) > 1 else None
+        data = self.data
+        self.parent_data: dict = data[0]
+        self.identifier = self.parent_data.get('ID')
+        self.child_data: Optional[dict] = data[1] if len(data) > 1 else None
         self.parse_location: bool = parse_location
         self.thingspeak_data: dict = {}
         self.parent: Channel = Channel(channel_data=self.parent_data,)
         self.child: Optional[Channel] = Channel(
             channel_data=self.child_data) if self.child_data else None
         self.location_type: Optional[str] = self.parent.location_type
+        self._invalid_mask: int = self.get_invalid_mask()
         # Parse the location (slow, so must be manually enabled)
         self.location: str = ''
         if self.parse_location:
@@ -60,6 +78,29 @@ class Sensor():
         """
         return self.parent.created_date
 
+    @staticmethod
+    def list_all() -> Iterator[dict]:
+        """
+        Fetch the whole PurpleAir network once, yielding the raw data of each channel
+
+        Parent and child channels are yielded separately, with `Stats` already parsed
+        """
+        response = _get_session('purpleair_cache').get(f'{API_ROOT}?q=""')
+        try:
+            data = json_loads(response.content)
+        except JSONDecodeError as err:
+            raise ValueError(
+                'Invalid JSON data returned from network!') from err
+
+        # Handle rate limit or other error message
+        if 'results' not in data:
+            message = data.get('message')
+            error_message = message if message is not None else data
+            raise ValueError(
+                f'No sensor data returned from PurpleAir: {error_message}')
+
+        yield from bulk_prepare(data['results'])
+
     # pylint: disable=no-self-use
     def get_data(self, identifier: int) -> Optional[list]:
         """
@@ -70,9 +111,8 @@ class Sensor():
             raise ValueError(f'Invalid sensor ID: {identifier}')
 
         # Fetch the JSON for parent and child sensors
-        session = CachedSession(expire_after=timedelta(hours=1))
-        response = session.get(f'{API_ROOT}?show={identifier}')
-        data = json.loads(response.content)
+        response = _get_session('purpleair_cache').get(f'{API_ROOT}?show={identifier}')
+        data = json_loads(response.content)
         channel_data: Optional[list] = data.get('results')
 
         # Handle various API problems
@@ -83,8 +123,8 @@ class Sensor():
             except IndexError:
                 raise IndexError from IndexError(
                     f'Parent sensor for {identifier} does not exist!')
-            response = session.get(f'{API_ROOT}?show={parent_id}')
-            data = json.loads(response.content)
+            response = _get_session('purpleair_cache').get(f'{API_ROOT}?show={parent_id}')
+            data = json_loads(response.content)
             channel_data = data.get('results')
         elif channel_data and len(channel_data) > 2:
             print(json.dumps(data, indent=4))
@@ -99,50 +139,58 @@ class Sensor():
         self.thingspeak_data[field] = {'primary': {}, 'secondary': {}}
 
         # Primary
-        self.thingspeak_data[field]['primary']['channel_a'] = json.loads(
+        self.thingspeak_data[field]['primary']['channel_a'] = json_loads(
             self.parent.thingspeak_primary.get_field(field=field)) \
             if self.parent.thingspeak_primary else None
-        self.thingspeak_data[field]['primary']['channel_b'] = json.loads(
+        self.thingspeak_data[field]['primary']['channel_b'] = json_loads(
             self.child.thingspeak_primary.get_field(field=field)) \
             if self.child and self.child.thingspeak_primary else None
 
         # Secondary
-        self.thingspeak_data[field]['secondary']['channel_a'] = json.loads(
+        self.thingspeak_data[field]['secondary']['channel_a'] = json_loads(
             self.parent.thingspeak_secondary.get_field(field=field)) \
             if self.parent.thingspeak_secondary else None
-        self.thingspeak_data[field]['secondary']['channel_b'] = json.loads(
+        self.thingspeak_data[field]['secondary']['channel_b'] = json_loads(
             self.child.thingspeak_secondary.get_field(field=field)) \
             if self.child and self.child.thingspeak_secondary else None
 
     def is_useful(self) -> bool:
         """
-        Function to dump broken sensors; expanded like this so we can collect metrics later
-        """
-        if self.parent.lat is None or self.parent.lon is None:
-            return False
-        if self.parent.hidden:
-            return False
-        if self.parent.flagged:
-            return False
-        if self.parent.downgraded:
-            return False
-        if self.parent.current_pm2_5 is None:
-            return False
-        if self.parent.current_temp_f is None:
-            return False
-        if self.parent.current_humidity is None:
-            return False
-        if self.parent.current_pressure is None:
-            return False
-        if not self.parent.channel_data.get('Stats', None):
-            # Happens before stats because they will be missing if this is
-            # missing
-            return False
-        if self.parent.last_modified_stats is None:
-            return False
-        if self.parent.last2_modified is None:
-            return False
-        return True
+        Function to dump broken sensors; each failed check sets a bit in `_invalid_mask`
+        so we can collect metrics later
+        """
+        return self._invalid_mask == 0
+
+    def get_invalid_mask(self) -> int:
+        """
+        Bitmask of the `is_useful` checks the parent channel fails, 0 if it passes all of them
+        """
+        parent = self.parent
+        mask = 0
+        if parent.lat is None or parent.lon is None:
+            mask |= INVALID_LOCATION
+        if parent.hidden:
+            mask |= INVALID_HIDDEN
+        if parent.flagged:
+            mask |= INVALID_FLAGGED
+        if parent.downgraded:
+            mask |= INVALID_DOWNGRADED
+        if parent.current_pm2_5 is None:
+            mask |= INVALID_PM2_5
+        if parent.current_temp_f is None:
+            mask |= INVALID_TEMP_F
+        if parent.current_humidity is None:
+            mask |= INVALID_HUMIDITY
+        if parent.current_pressure is None:
+            mask |= INVALID_PRESSURE
+        if not parent.channel_data.get('Stats', None):
+            # Checked before stats because they will be missing if this is missing
+            mask |= INVALID_STATS
+        if parent.last_modified_stats is None:
+            mask |= INVALID_LAST_MODIFIED_STATS
+        if parent.last2_modified is None:
+            mask |= INVALID_LAST2_MODIFIED
+        return mask
 
     def get_location(self) -> None:
         """
@@ -21,6 +21,7 @@ setup(
     packages=find_packages(),
     install_requires=['requests', 'requests_cache',
                       'thingspeak', 'geopy', 'pandas'],
+    extras_require={'fast': ['orjson', 'pyarrow']},
     python_requires='>=3.6',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -2,7 +2,10 @@ import unittest
 
 from purpleair import sensor
 from purpleair import api_data
+from purpleair import channel
 import datetime
+import math
+import pandas as pd
 
 class TestChannelMethods(unittest.TestCase):
     """
@@ -16,6 +19,65 @@ class TestChannelMethods(unittest.TestCase):
         se = sensor.Sensor(2891)
         self.assertEqual(se.child.__repr__(), 'Sensor 2891, child of 2890')
 
+    def test_bulk_prepare(self):
+        """
+        Test that pre-parsed Stats produce the same Channel as raw Stats
+        """
+        se = sensor.Sensor(2891)
+        expected = se.parent.as_dict()
+        prepared = channel.bulk_prepare([dict(data) for data in se.data])
+        self.assertIsInstance(prepared[0]['Stats'], dict)
+        self.assertEqual(channel.Channel(prepared[0]).as_dict(), expected)
+
+    def test_bulk_from_results(self):
+        """
+        Test that the bulk DataFrame holds the same values as the channels
+        """
+        se = sensor.Sensor(2891)
+        results = [dict(d) for d in se.data]
+        data = channel.Channel.bulk_from_results(results)
+        self.assertEqual(len(data), len(se.data))
+        self.assertEqual(results, se.data)
+        self.assertEqual(data['PM2_5Value'][0], se.parent.current_pm2_5)
+        self.assertEqual(data['Stats.v1'][0], se.parent.m10avg)
+        self.assertEqual(data['LastSeen'][0], se.parent.last_seen)
+
+    def test_to_float(self):
+        """
+        Test that bulk float coercion agrees with `float()`
+        """
+        values = ['5.69', '-0.5', ' 12 ', '1e3', '.5', '+3.25',
+                  '1234567890123456', 'inf', '1_000', '1.5e-30', 1.5, 2]
+        for value in values:
+            self.assertEqual(channel._to_float(value), float(value))
+
+    def test_to_float_invalid(self):
+        """
+        Test that values which are not numbers become NaN
+        """
+        for value in ['abc', '', None, '1__000', '--1']:
+            self.assertTrue(math.isnan(channel._to_float(value)))
+
+    def test_parse_thingspeak_csv(self):
+        """
+        Test that ThingSpeak CSVs without `entry_id` or all eight fields are typed
+        """
+        content = b'created_at,field1,field2\n2020-01-01 00:00:00 UTC,1.5,2\n'
+        data = channel._parse_thingspeak_csv(content)
+        self.assertEqual(list(data.columns), ['created_at', 'field1', 'field2'])
+        self.assertEqual(data['field1'].dtype, 'float64')
+        self.assertEqual(data['field2'].dtype, 'float64')
+
+    def test_clean_data_empty(self):
+        """
+        Test that an empty ThingSpeak result is cleaned without errors
+        """
+        header = ','.join(api_data.PARENT_PRIMARY_COLS).encode() + b'\n'
+        data = channel._parse_thingspeak_csv(header)
+        cleaned = channel.Channel({'ID': 1}).clean_data('primary', data)
+        self.assertEqual(len(cleaned), 0)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(cleaned['created_at']))
+
     def test_get_historical(self):
         """
         Test that we properly get a sensor's historical data
@@ -58,6 +58,15 @@ class TestSensorMethods(unittest.TestCase):
         se = sensor.Sensor(2891)
         self.assertEqual(se.__repr__(), 'Sensor 2890')
 
+    def test_list_all(self):
+        """
+        Test that we can iterate over every channel in the network
+        """
+        channels = sensor.Sensor.list_all()
+        first = next(channels)
+        self.assertIn('ID', first)
+        self.assertGreater(sum(1 for _ in channels), 0)
+
     def test_is_useful(self):
         """
         Test that we ensure a useful sensor is useful
@@ -79,6 +88,16 @@ class TestSensorMethods(unittest.TestCase):
         se = sensor.Sensor(18463)
         self.assertEqual(se.is_useful(), False)
 
+    def test_invalid_mask(self):
+        """
+        Test that the invalid mask records why a sensor is not useful
+        """
+        self.assertEqual(sensor.Sensor(81879).get_invalid_mask(), 0)
+        self.assertTrue(sensor.Sensor(61639).get_invalid_mask()
+                        & sensor.INVALID_FLAGGED)
+        self.assertTrue(sensor.Sensor(18463).get_invalid_mask()
+                        & sensor.INVALID_DOWNGRADED)
+
     def test_as_dict(self):
         """
         Test that the dictionary export data is shaped correctly